@@ -13,7 +13,7 @@ sys.path.insert(0, str(project_root / "src"))
 
 # Import our Base and database configuration
 from common.base import Base
-from config.database_config import db
+from config.database_config import get_database_url
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,7 +31,8 @@ import model  # noqa: F401
 target_metadata = Base.metadata
 
 # Override sqlalchemy.url from alembic.ini with our database configuration
-config.set_main_option("sqlalchemy.url", db._build_connection_url())
+# ("%" is escaped because alembic.ini values go through ConfigParser interpolation)
+config.set_main_option("sqlalchemy.url", get_database_url().replace("%", "%%"))
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -0,0 +1,55 @@
+"""Database-side defaults for user timestamps
+
+Timestamps become naive UTC values at database precision (whole seconds for
+SQLite CURRENT_TIMESTAMP and MySQL UTC_TIMESTAMP()) instead of Python-side
+timezone-aware datetimes with microseconds.
+MySQL: the expression default "(UTC_TIMESTAMP())" requires MySQL 8.0.13+.
+
+Revision ID: dadfe6271c79
+Revises: 1eb565dea3cb
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dadfe6271c79'
+down_revision: Union[str, Sequence[str], None] = '1eb565dea3cb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Current UTC time per dialect (mirrors common.base.utcnow)
+_UTC_NOW = {
+    "mysql": "(UTC_TIMESTAMP())",
+    "oracle": "SYS_EXTRACT_UTC(SYSTIMESTAMP)",
+}
+
+
+def _set_timestamp_defaults(server_default) -> None:
+    """Set (or clear) the server default of users.created_at/updated_at"""
+    # Tables are created by init_db(); a database without one gets the defaults from the model
+    if not sa.inspect(op.get_bind()).has_table("users"):
+        return
+    with op.batch_alter_table("users") as batch_op:
+        for column in ("created_at", "updated_at"):
+            batch_op.alter_column(
+                column,
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=server_default,
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    _set_timestamp_defaults(sa.text(_UTC_NOW.get(dialect, "CURRENT_TIMESTAMP")))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_timestamp_defaults(None)
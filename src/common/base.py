@@ -3,7 +3,10 @@ Common Base for all ORM Models
 Centralized DeclarativeBase to avoid circular imports and manual model registration
 """
 
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 
 
 class Base(DeclarativeBase):
@@ -19,3 +22,33 @@ class Base(DeclarativeBase):
             id: Mapped[int] = mapped_column(primary_key=True)
     """
     pass
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time, evaluated by the database
+    Use as server_default/onupdate so timestamps come from one clock
+    
+    Example:
+        created_at: Mapped[datetime] = mapped_column(server_default=utcnow())
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    """SQLite (and generic) - CURRENT_TIMESTAMP is already UTC"""
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw):
+    """MySQL - CURRENT_TIMESTAMP follows the session time zone; parenthesized for DEFAULT"""
+    return "(UTC_TIMESTAMP())"
+
+
+@compiles(utcnow, "oracle")
+def _utcnow_oracle(element, compiler, **kw):
+    """Oracle - SYSTIMESTAMP converted to UTC"""
+    return "SYS_EXTRACT_UTC(SYSTIMESTAMP)"
@@ -1,12 +1,12 @@
 """
 Application Startup Banner
 """
-from config.app_config import config
+import sys
 
+from config.app_config import config
 
-def print_banner():
-    """Print application startup banner"""
-    banner = f"""
+# Static banner art with %-style placeholders, filled in by print_banner()
+_BANNER_TEMPLATE: str = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                                                                   ║
 ║     ███████╗ █████╗ ███████╗████████╗ █████╗ ██████╗ ██╗          ║
@@ -19,16 +19,30 @@ def print_banner():
 ║                 Starter Template by Raizurai                      ║
 ║                                                                   ║
 ╚═══════════════════════════════════════════════════════════════════╝
-    Application: {config.app_name:<45}                                 
+    Application: %(app_name)-45s                                 
     Version:     1.0.0                                               
-    Database:    {config.db_type.upper():<45} 
-    Log Level:   {config.log_level:<45} 
-    Debug Mode:  {'Enabled' if config.debug else 'Disabled':<45}
-    Reload:      {'Enabled' if config.server_reload else 'Disabled':<45}
+    Database:    %(db_type)-45s 
+    Log Level:   %(log_level)-45s 
+    Debug Mode:  %(debug)-45s
+    Reload:      %(reload)-45s
 ══════════════════════════════════════════════════════════════════════════  
-    Server:      http://{config.server_host}:{config.server_port:<38}
-    API Docs:    http://{config.server_host}:{config.server_port}/docs{' ' * 33} 
-    API Prefix:  {config.api_prefix:<45} 
+    Server:      http://%(server_host)s:%(server_port)-38s
+    API Docs:    http://%(server_host)s:%(server_port)s/docs                                  
+    API Prefix:  %(api_prefix)-45s 
 ══════════════════════════════════════════════════════════════════════════
 """
-    print(banner)
+
+
+def print_banner():
+    """Print application startup banner"""
+    vals = {
+        "app_name": config.app_name,
+        "db_type": config.db_type.upper(),
+        "log_level": config.log_level,
+        "debug": "Enabled" if config.debug else "Disabled",
+        "reload": "Enabled" if config.server_reload else "Disabled",
+        "server_host": config.server_host,
+        "server_port": config.server_port,
+        "api_prefix": config.api_prefix,
+    }
+    sys.stdout.write(_BANNER_TEMPLATE % vals + "\n")
@@ -4,31 +4,72 @@ OpenAPI Schema Generator Utility
 
 import json
 from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 from fastapi import FastAPI
 import logging
 
+from config.app_config import config
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Output path -> (app version, schema) of the last file written in this process
+_written_schemas: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
 
-def generate_openapi_file(app: FastAPI, output_path: str = "openapi.json") -> None:
+def generate_openapi_file(
+    app: FastAPI,
+    output_path: str = "openapi.json",
+    version: Optional[str] = None,
+) -> None:
     """
     Generate OpenAPI schema file from FastAPI application
+    Repeated calls for the same path and version reuse the schema already
+    written in this process instead of regenerating it
     
     Args:
         app: FastAPI application instance
         output_path: Path where the OpenAPI JSON file will be saved
+        version: Version stamp for the cached schema (defaults to app.version)
     """
     try:
-        # Get OpenAPI schema
-        openapi_schema = app.openapi()
+        version_stamp = version or app.version
         
         # Resolve output path
         output_file = Path(output_path)
+        cache_key = str(output_file.absolute())
+        
+        cached = _written_schemas.get(cache_key)
+        if cached is not None and cached[0] == version_stamp and output_file.exists():
+            # Seed FastAPI's cache so /openapi.json skips regeneration too
+            if app.openapi_schema is None:
+                app.openapi_schema = cached[1]
+            logger.debug(f"OpenAPI schema unchanged, skipping write: {cache_key}")
+            return
+        
+        # Get OpenAPI schema
+        openapi_schema = app.openapi()
         
-        # Write to file
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(openapi_schema, f, indent=2, ensure_ascii=False)
+        # Pretty-print only in debug mode
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if config.debug else 0
+            output_file.write_bytes(orjson.dumps(openapi_schema, option=option))
+        else:
+            # Compact output stays on the stdlib C encoder
+            if config.debug:
+                content = json.dumps(openapi_schema, indent=2, ensure_ascii=False)
+            else:
+                content = json.dumps(openapi_schema, ensure_ascii=False, separators=(",", ":"))
+            
+            # Write to file in a single buffered write
+            with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                f.write(content)
         
+        _written_schemas[cache_key] = (version_stamp, openapi_schema)
         logger.info(f"OpenAPI schema generated successfully: {output_file.absolute()}")
     except Exception as e:
         logger.error(f"Failed to generate OpenAPI schema: {str(e)}")
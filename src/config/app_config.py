@@ -11,11 +11,14 @@ How to add new configuration settings:
 2. Add environment variable override in _override_from_env() method:
    self._config["section_name"]["setting_key"] = os.getenv("ENV_VAR_NAME", self._config["section_name"].get("setting_key"))
 
-3. Add a convenience property (optional but recommended):
-   @property
-   def setting_key(self) -> str:
-       '''Description of the setting'''
-       return self.get("section_name", "setting_key", "default_value")
+3. Add a convenience attribute (optional but recommended):
+   Register its default in _DEFAULTS, annotate it on the class and
+   resolve it once in _cache_settings():
+   ("section_name", "setting_key"): "default_value",
+   ...
+   setting_key: str
+   ...
+   self.setting_key = self._flat[("section_name", "setting_key")]
 
 4. Document the environment variable in .env.example:
    ENV_VAR_NAME=default_value
@@ -28,17 +31,115 @@ Example:
    # In _override_from_env()
    self._config["application"]["api_timeout"] = int(os.getenv("API_TIMEOUT", self._config["application"].get("api_timeout", 30)))
 
-   # Property (optional)
-   @property
-   def api_timeout(self) -> int:
-       return self.get("application", "api_timeout", 30)
+   # Attribute (optional)
+   ("application", "api_timeout"): 30,   # In _DEFAULTS
+   api_timeout: int                      # On AppConfig
+   ...
+   # In _cache_settings()
+   self.api_timeout = self._flat[("application", "api_timeout")]
 """
 
 import os
-import toml
+import re
 from pathlib import Path
-from typing import Any, Dict, List
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Tuple
+
+# Matches ${VAR_NAME} or $VAR_NAME placeholders
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+# Matches plain (optionally negative) integer strings
+_INT_RE = re.compile(r'-?\d+\Z')
+
+
+def _replace_env(match: re.Match) -> str:
+    """Replace a placeholder match with its environment variable value"""
+    var_name = match.group(1) or match.group(2)
+    env_value = os.getenv(var_name)
+    
+    # If env var not found, keep placeholder
+    if env_value is None:
+        return match.group(0)
+    
+    # Return the string value (don't convert yet)
+    return env_value
+
+
+def _expand_str(value: str) -> Any:
+    """
+    Expand environment variables in a single config string
+    
+    Args:
+        value: Raw string value from TOML
+        
+    Returns:
+        Expanded value, coerced to bool/int when a placeholder was replaced,
+        or None if the placeholder could not be resolved
+    """
+    # Most TOML strings have no placeholder - skip the regex entirely
+    if '$' not in value:
+        return value
+    
+    # Replace ${VAR} or $VAR with environment variable value
+    result = _ENV_VAR_RE.sub(_replace_env, value)
+    
+    # If the entire string is still a placeholder, return None so defaults can be used
+    if result.startswith('${') and result.endswith('}'):
+        return None
+    if result.startswith('$') and result == value:
+        return None
+    
+    # Convert string booleans and numbers if entire string was replaced
+    if result != value:
+        if result.lower() in ('true', 'false'):
+            return result.lower() == 'true'
+        if _INT_RE.match(result):
+            return int(result)
+    return result
+
+
+# Defaults for every known setting, folded into the flattened config at load
+# time so lookups for these keys never need a fallback
+_DEFAULTS: Dict[Tuple[str, str], Any] = {
+    ("application", "app_name"): "FastAPI Application",
+    ("application", "debug"): False,
+    ("application", "api_prefix"): "/api/v1",
+
+    ("server", "host"): "0.0.0.0",
+    ("server", "port"): 8000,
+    ("server", "reload"): False,
+    ("server", "workers"): 1,
+    ("server", "threadpool_size"): 40,
+
+    ("cors", "origins"): ["*"],
+    ("cors", "allow_credentials"): True,
+    ("cors", "allow_methods"): ["*"],
+    ("cors", "allow_headers"): ["*"],
+
+    ("database", "db_type"): "mysql",
+    ("database", "host"): "localhost",
+    ("database", "port"): 3306,
+    ("database", "username"): "",
+    ("database", "password"): "",
+    ("database", "database"): "",
+    ("database", "service_name"): "",
+    ("database", "health_check_on_startup"): True,
+    ("database", "sqlite_file"): "fastapi_db.sqlite",
+
+    ("database.pool", "pool_size"): 20,
+    ("database.pool", "max_overflow"): 20,
+    ("database.pool", "pool_recycle"): 1800,
+    ("database.pool", "pool_timeout"): 5,
+
+    ("logging", "log_level"): "INFO",
+    ("logging", "log_to_file"): True,
+    ("logging", "log_dir"): "logs",
+    ("logging", "detailed_logs"): False,
+    ("logging", "rotation_type"): "size",
+    ("logging", "max_bytes"): 10485760,
+    ("logging", "backup_count"): 5,
+    ("logging", "rotation_when"): "midnight",
+    ("logging", "rotation_interval"): 1,
+    ("logging", "rotation_backup_count"): 30,
+}
 
 
 class AppConfig:
@@ -46,6 +147,43 @@ class AppConfig:
     
     _instance = None
     _config: Dict[str, Any] = {}
+    _flat: Dict[Tuple[str, str], Any] = {}
+    
+    # Convenience attributes for common configurations (see _cache_settings)
+    db_type: str
+    db_host: str
+    db_port: int
+    db_username: str
+    db_password: str
+    db_database: str
+    db_service_name: str
+    db_health_check_on_startup: bool
+    db_pool_size: int
+    db_max_overflow: int
+    db_pool_recycle: int
+    db_pool_timeout: int
+    app_name: str
+    debug: bool
+    api_prefix: str
+    cors_origins: Tuple[str, ...]
+    cors_allow_credentials: bool
+    cors_allow_methods: Tuple[str, ...]
+    cors_allow_headers: Tuple[str, ...]
+    server_host: str
+    server_port: int
+    server_reload: bool
+    server_workers: int
+    server_threadpool_size: int
+    log_level: str
+    log_to_file: bool
+    log_dir: str
+    detailed_logs: bool
+    rotation_type: str
+    max_bytes: int
+    backup_count: int
+    rotation_when: str
+    rotation_interval: int
+    rotation_backup_count: int
     
     def __new__(cls):
         """Singleton pattern to ensure single config instance"""
@@ -56,6 +194,9 @@ class AppConfig:
     
     def _load_config(self):
         """Load configuration from TOML file and expand environment variables"""
+        # Parser/dotenv imports are deferred here since config loads once per process
+        from dotenv import load_dotenv
+        
         # Load .env file first
         env_path = Path(__file__).parent.parent.parent / ".env"
         if env_path.exists():
@@ -66,78 +207,74 @@ class AppConfig:
         
         # Load TOML configuration
         if config_path.exists():
-            self._config = toml.load(config_path)
+            try:
+                import tomllib  # Python 3.11+
+            except ModuleNotFoundError:  # Python 3.10 fallback
+                import toml
+                self._config = toml.load(config_path)
+            else:
+                with open(config_path, "rb") as f:
+                    self._config = tomllib.load(f)
         else:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         # Expand environment variables in config values
         self._expand_env_vars()
+        
+        # Flatten to (section, key) lookups; nested tables such as
+        # [database.pool] become dotted sections ("database.pool", key).
+        # Unresolved (None) values are left out so get() falls back to the default
+        self._flat = {}
+        tables = [(section, values) for section, values in self._config.items() if isinstance(values, dict)]
+        while tables:
+            section, values = tables.pop()
+            for key, value in values.items():
+                if isinstance(value, dict):
+                    tables.append((f"{section}.{key}", value))
+                elif value is not None:
+                    self._flat[(section, key)] = value
+        for flat_key, default in _DEFAULTS.items():
+            self._flat.setdefault(flat_key, default)
+        
+        # Normalize db_type once so consumers can compare it directly
+        self._flat[("database", "db_type")] = str(self._flat[("database", "db_type")]).lower()
+        
+        self._cache_settings()
     
-    def _expand_env_vars(self, obj=None):
+    def _expand_env_vars(self) -> Dict[str, Any]:
         """
-        Recursively expand environment variables in config
+        Expand environment variables in config values in place
         Supports ${VAR_NAME} or $VAR_NAME syntax
-        """
-        import re
         
-        if obj is None:
-            obj = self._config
-        
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                obj[key] = self._expand_env_vars(value)
-        elif isinstance(obj, list):
-            return [self._expand_env_vars(item) for item in obj]
-        elif isinstance(obj, str):
-            # Replace ${VAR} or $VAR with environment variable value
-            def replace_env(match):
-                var_name = match.group(1) or match.group(2)
-                env_value = os.getenv(var_name)
-                
-                # If env var not found, keep placeholder
-                if env_value is None:
-                    return match.group(0)
-                
-                # Return the string value (don't convert yet)
-                return env_value
-            
-            # Match ${VAR_NAME} or $VAR_NAME
-            pattern = r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
-            result = re.sub(pattern, replace_env, obj)
-            
-            # If the entire string is still a placeholder, return None so defaults can be used
-            if result.startswith('${') and result.endswith('}'):
-                return None
-            if result.startswith('$') and result == obj:
-                return None
-            
-            # Convert string booleans and numbers if entire string was replaced
-            if result != obj:
-                if result.lower() in ('true', 'false'):
-                    return result.lower() == 'true'
-                try:
-                    return int(result)
-                except ValueError:
-                    pass
-            return result
+        Walks nested tables and arrays iteratively with an explicit stack.
         
-        return obj
+        Returns:
+            The expanded configuration dictionary
+        """
+        stack: List[Any] = [self._config]
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, str):
+                    container[key] = _expand_str(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        return self._config
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
         Get configuration value
         
         Args:
-            section: Configuration section (e.g., 'database', 'application')
+            section: Configuration section (e.g., 'database', 'database.pool')
             key: Configuration key
             default: Default value if key not found
             
         Returns:
             Configuration value
         """
-        value = self._config.get(section, {}).get(key)
-        # If value is None (env var not set), use the default
-        return value if value is not None else default
+        return self._flat.get((section, key), default)
     
     def get_section(self, section: str) -> Dict[str, Any]:
         """
@@ -151,127 +288,78 @@ class AppConfig:
         """
         return self._config.get(section, {})
     
-    # Convenience properties for common configurations
-    @property
-    def db_type(self) -> str:
-        # Database type (mysql or oracle)
-        return self.get("database", "db_type", "mysql")
-    
-    @property
-    def db_host(self) -> str:
+    def _cache_settings(self):
+        """
+        Resolve convenience attributes once from the loaded configuration
+        Config is a process-wide singleton, so these values never change after load
+        """
+        # Database type (sqlite, mysql or oracle), lowercased at load
+        self.db_type = self._flat[("database", "db_type")]
         # Database host
-        return self.get("database", "host", "localhost")
-    
-    @property
-    def db_port(self) -> int:
+        self.db_host = self._flat[("database", "host")]
         # Database port
-        return self.get("database", "port", 3306)
-    
-    @property
-    def db_username(self) -> str:
+        self.db_port = self._flat[("database", "port")]
         # Database username
-        return self.get("database", "username", "")
-    
-    @property
-    def db_password(self) -> str:
+        self.db_username = self._flat[("database", "username")]
         # Database password
-        return self.get("database", "password", "")
-    
-    @property
-    def db_database(self) -> str:
+        self.db_password = self._flat[("database", "password")]
         # Database name
-        return self.get("database", "database", "")
-    
-    @property
-    def db_service_name(self) -> str:
+        self.db_database = self._flat[("database", "database")]
         # Oracle service name
-        return self.get("database", "service_name", "")
-    
-    @property
-    def app_name(self) -> str:
+        self.db_service_name = self._flat[("database", "service_name")]
+        # Test the database connection when the engine is created
+        self.db_health_check_on_startup = self._flat[("database", "health_check_on_startup")]
+        # Connection pool size (MySQL/Oracle)
+        self.db_pool_size = self._flat[("database.pool", "pool_size")]
+        # Extra connections allowed beyond pool_size
+        self.db_max_overflow = self._flat[("database.pool", "max_overflow")]
+        # Seconds after which pooled connections are recycled
+        self.db_pool_recycle = self._flat[("database.pool", "pool_recycle")]
+        # Seconds to wait for a pooled connection before giving up
+        self.db_pool_timeout = self._flat[("database.pool", "pool_timeout")]
         # Application name
-        return self.get("application", "app_name", "FastAPI Application")
-    
-    @property
-    def debug(self) -> bool:
+        self.app_name = self._flat[("application", "app_name")]
         # Debug mode
-        return self.get("application", "debug", False)
-    
-    @property
-    def api_prefix(self) -> str:
+        self.debug = self._flat[("application", "debug")]
         # API prefix path
-        return self.get("application", "api_prefix", "/api/v1")
-    
-    @property
-    def cors_origins(self) -> List[str]:
-        # CORS allowed origins
-        return self.get("cors", "origins", ["*"])
-    
-    @property
-    def server_host(self) -> str:
+        self.api_prefix = self._flat[("application", "api_prefix")]
+        # CORS allowed origins (immutable, hashable tuple)
+        self.cors_origins = tuple(self._flat[("cors", "origins")])
+        # CORS credentials, methods and headers
+        self.cors_allow_credentials = self._flat[("cors", "allow_credentials")]
+        self.cors_allow_methods = tuple(self._flat[("cors", "allow_methods")])
+        self.cors_allow_headers = tuple(self._flat[("cors", "allow_headers")])
         # Server host
-        return self.get("server", "host", "0.0.0.0")
-    
-    @property
-    def server_port(self) -> int:
+        self.server_host = self._flat[("server", "host")]
         # Server port
-        return self.get("server", "port", 8000)
-    
-    @property
-    def server_reload(self) -> bool:
+        self.server_port = self._flat[("server", "port")]
         # Server auto-reload
-        return self.get("server", "reload", False)
-    
-    @property
-    def log_level(self) -> str:
+        self.server_reload = self._flat[("server", "reload")]
+        # Number of worker processes (ignored when reload is enabled)
+        self.server_workers = self._flat[("server", "workers")]
+        # Threads available per worker for sync endpoints (and their DB calls)
+        self.server_threadpool_size = self._flat[("server", "threadpool_size")]
         # Logging level
-        return self.get("logging", "log_level", "INFO")
-    
-    @property
-    def log_to_file(self) -> bool:
+        self.log_level = self._flat[("logging", "log_level")]
         # Log to file
-        return self.get("logging", "log_to_file", True)
-    
-    @property
-    def log_dir(self) -> str:
+        self.log_to_file = self._flat[("logging", "log_to_file")]
         # Log directory
-        return self.get("logging", "log_dir", "logs")
-    
-    @property
-    def detailed_logs(self) -> bool:
+        self.log_dir = self._flat[("logging", "log_dir")]
         # Detailed logging with file and line numbers
-        return self.get("logging", "detailed_logs", False)
-    
-    @property
-    def rotation_type(self) -> str:
+        self.detailed_logs = self._flat[("logging", "detailed_logs")]
         # Log rotation type: "size" or "time"
-        return self.get("logging", "rotation_type", "size")
-    
-    @property
-    def max_bytes(self) -> int:
+        self.rotation_type = self._flat[("logging", "rotation_type")]
         # Maximum log file size before rotation (for size-based rotation)
-        return self.get("logging", "max_bytes", 10485760)
-    
-    @property
-    def backup_count(self) -> int:
+        self.max_bytes = self._flat[("logging", "max_bytes")]
         # Number of backup files to keep (for size-based rotation)
-        return self.get("logging", "backup_count", 5)
-    
-    @property
-    def rotation_when(self) -> str:
+        self.backup_count = self._flat[("logging", "backup_count")]
         # When to rotate logs (for time-based rotation)
         # Options: "S", "M", "H", "D", "midnight", "W0"-"W6"
-        return self.get("logging", "rotation_when", "midnight")
-    
-    @property
-    def rotation_interval(self) -> int:
+        self.rotation_when = self._flat[("logging", "rotation_when")]
         # Rotation interval (for time-based rotation)
-        return self.get("logging", "rotation_interval", 1)
-    
-    @property
-    def rotation_backup_count(self) -> int:
+        self.rotation_interval = self._flat[("logging", "rotation_interval")]
         # Number of backup files to keep (for time-based rotation)
-        return self.get("logging", "rotation_backup_count", 30)
+        self.rotation_backup_count = self._flat[("logging", "rotation_backup_count")]
 
 
 # Create singleton instance
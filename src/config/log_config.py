@@ -3,12 +3,100 @@ Logging Configuration Module
 Centralized logging setup for the application
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
+import threading
+import time
 from pathlib import Path
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Dict, Tuple
+
+
+# Request ID of the request being handled in the current context ("-" outside requests)
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Background queue listeners with their logger and feeding QueueHandler, keyed by logger name
+_listeners: Dict[str, Tuple[logging.Logger, QueueListener, QueueHandler]] = {}
+
+
+class RequestIdFilter(logging.Filter):
+    """
+    Attach the current request ID to every record as `record.request_id`
+    Installed on the QueueHandler so it runs in the logging caller's context
+    """
+    
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+# Shared filter instance - reads the context variable, holds no state
+_request_id_filter = RequestIdFilter()
+
+
+def _attach_queue_handler(target_logger: logging.Logger, *handlers: logging.Handler) -> QueueListener:
+    """
+    Attach handlers to a logger through a queue
+    The logger only gets a QueueHandler (an O(1) put); the real handlers run on
+    a QueueListener background thread so file/console I/O stays off the event loop
+    
+    Args:
+        target_logger: Logger to attach the QueueHandler to
+        handlers: Handlers that process records on the listener thread
+        
+    Returns:
+        Started QueueListener instance
+    """
+    # Stop any listener left over from a previous setup of the same logger
+    previous = _listeners.pop(target_logger.name, None)
+    if previous is not None:
+        _, previous_listener, previous_handler = previous
+        previous_listener.stop()
+        target_logger.removeHandler(previous_handler)
+    
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(_request_id_filter)
+    target_logger.addHandler(queue_handler)
+    _listeners[target_logger.name] = (target_logger, listener, queue_handler)
+    return listener
+
+
+def stop_logging() -> None:
+    """
+    Stop all background log listeners, flushing any queued records
+    Each logger gets its real handlers back (attached directly), so records
+    logged afterwards - e.g. by a later app lifespan - are still written
+    Safe to call more than once; also registered to run at interpreter exit
+    """
+    while _listeners:
+        _, (target_logger, listener, queue_handler) = _listeners.popitem()
+        listener.stop()
+        target_logger.removeHandler(queue_handler)
+        for handler in listener.handlers:
+            # Drain anything still held by buffering handlers
+            handler.flush()
+            # Hand the real handler back to the logger for records logged later;
+            # the request-id filter lived on the QueueHandler, so move it along
+            handler.addFilter(_request_id_filter)
+            target_logger.addHandler(handler)
+
+
+atexit.register(stop_logging)
 
 
 class SizeAndTimeRotatingFileHandler(TimedRotatingFileHandler):
@@ -39,17 +127,126 @@ class SizeAndTimeRotatingFileHandler(TimedRotatingFileHandler):
         if super().shouldRollover(record):
             return True
         
-        # Check size-based rollover
-        if self.maxBytes > 0:
-            msg = "%s\n" % self.format(record)
-            self.stream.seek(0, 2)  # Go to end of file
-            if self.stream.tell() + len(msg.encode('utf-8')) >= self.maxBytes:
-                return True
+        # Check size-based rollover against the current file position
+        # (like RotatingFileHandler, a file may overshoot maxBytes by one record)
+        if self.maxBytes > 0 and self.stream is not None and self.stream.tell() >= self.maxBytes:
+            return True
         
         return False
 
 
-class ColoredFormatter(logging.Formatter):
+class BufferedFileHandler(MemoryHandler):
+    """
+    Buffering wrapper that coalesces records for a file handler.
+    Flushes when `capacity` records are buffered, on ERROR or above, or at most
+    `flush_interval` seconds after a record arrives, from a daemon thread that
+    sleeps while the buffer is empty.
+    A flush hands the whole batch to the target and flushes its stream once.
+    """
+    
+    def __init__(self, target: logging.FileHandler, capacity: int = 512, flush_interval: float = 0.05):
+        """
+        Initialize the buffering handler.
+        
+        Args:
+            target: File handler that receives the batched records
+            capacity: Number of records to buffer before flushing
+            flush_interval: Maximum seconds a record stays buffered
+        """
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._stop = threading.Event()  # Not "_closed": Handler.close() sets that to True
+        self._pending = threading.Event()  # Set while the buffer holds records
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-buffer-flusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        """Flush flush_interval seconds after records arrive, until closed"""
+        while not self._stop.is_set():
+            self._pending.wait()
+            if self._stop.wait(self.flush_interval):
+                return
+            self.flush()
+    
+    def emit(self, record):
+        """Buffer the record and wake the flusher if it is still buffered"""
+        super().emit(record)
+        if self.buffer:
+            self._pending.set()
+    
+    def flush(self):
+        """Write all buffered records to the target with a single stream flush"""
+        with self.lock:
+            target = self.target
+            if not self.buffer or target is None:
+                return
+            with target.lock:
+                # StreamHandler.emit flushes after every record; defer that to
+                # one flush for the batch (the lock keeps other writers out)
+                target.flush = _skip_flush
+                try:
+                    for record in self.buffer:
+                        # Logger.callHandlers normally does the level check
+                        if record.levelno >= target.level:
+                            target.handle(record)
+                finally:
+                    del target.flush
+                target.flush()
+            self.buffer.clear()
+            self._pending.clear()
+    
+    def close(self):
+        """Stop the flusher thread, flush remaining records and close"""
+        self._stop.set()
+        self._pending.set()
+        super().close()
+
+
+def _skip_flush():
+    """Stand-in for a target's flush while BufferedFileHandler writes a batch"""
+
+
+class DebugOnlyFilter(logging.Filter):
+    """Pass only DEBUG records (used for the separate debug.log file)"""
+    
+    def filter(self, record):
+        return record.levelno == logging.DEBUG
+
+
+# Shared filter instance - filters are stateless, so one is enough
+_debug_only_filter = DebugOnlyFilter()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted timestamp for records in the same second.
+    With a second-resolution datefmt every record within one wall-clock second
+    renders the same asctime, so strftime runs about once per second.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted) pair, replaced as a whole so readers never see a torn update
+        self._time_cache = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            # Default format includes milliseconds, so it can't be shared per second
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, cached_str = self._time_cache
+        if second == cached_second:
+            return cached_str
+        
+        formatted = time.strftime(datefmt, self.converter(record.created))
+        self._time_cache = (second, formatted)
+        return formatted
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Custom formatter with colors for terminal output"""
     
     # ANSI color codes
@@ -64,11 +261,18 @@ class ColoredFormatter(logging.Formatter):
         'DIM': '\033[2m',         # Dim
     }
     
+    LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Colored level names, built once instead of per record
+        reset = self.COLORS['RESET']
+        self._colored = {level: f"{self.COLORS[level]}{level}{reset}" for level in self.LEVELS}
+    
     def format(self, record):
         # Color the level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        record.levelname = self._colored.get(levelname, levelname)
         
         # Format the message
         result = super().format(record)
@@ -79,6 +283,53 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+# File handler class per rotation type: "both" (time AND size), "time", "size" (default)
+_FILE_HANDLER_CLASSES = {
+    "both": SizeAndTimeRotatingFileHandler,
+    "time": TimedRotatingFileHandler,
+    "size": RotatingFileHandler,
+}
+
+# Time-based handlers take when/interval; size-based ones take maxBytes
+_TIME_BASED = (SizeAndTimeRotatingFileHandler, TimedRotatingFileHandler)
+_SIZE_BASED = (SizeAndTimeRotatingFileHandler, RotatingFileHandler)
+
+
+def make_file_handler(
+    path: Path,
+    rotation_type: str = "size",
+    max_bytes: int = 10485760,
+    backup_count: int = 5,
+    rotation_when: str = "midnight",
+    rotation_interval: int = 1,
+    rotation_backup_count: int = 30,
+) -> logging.FileHandler:
+    """
+    Create a rotating file handler for the given rotation strategy
+    
+    Args:
+        path: Log file path
+        rotation_type: "size", "time", or "both" (unknown values fall back to "size")
+        max_bytes: Maximum log file size before rotation (for size-based)
+        backup_count: Number of backup files to keep (for size-based only)
+        rotation_when: When to rotate - "midnight", "D", "H", etc. (for time-based)
+        rotation_interval: Rotation interval (for time-based)
+        rotation_backup_count: Number of backup files to keep (for time-based)
+    
+    Returns:
+        Configured file handler (UTF-8 encoded)
+    """
+    handler_class = _FILE_HANDLER_CLASSES.get(rotation_type.lower(), RotatingFileHandler)
+    kwargs = {"encoding": "utf-8"}
+    if handler_class in _TIME_BASED:
+        kwargs.update(when=rotation_when, interval=rotation_interval, backupCount=rotation_backup_count)
+    else:
+        kwargs["backupCount"] = backup_count
+    if handler_class in _SIZE_BASED:
+        kwargs["maxBytes"] = max_bytes
+    return handler_class(path, **kwargs)
+
+
 class LogConfig:
     """Logging configuration handler"""
     
@@ -92,8 +343,11 @@ class LogConfig:
     }
     
     # Default log format - Industry standard
-    DEFAULT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    DETAILED_FORMAT = "%(asctime)s | %(levelname)s | %(name)s:%(lineno)d | %(message)s"
+    DEFAULT_FORMAT = "%(asctime)s | %(levelname)s | %(request_id)s | %(name)s | %(message)s"
+    DETAILED_FORMAT = "%(asctime)s | %(levelname)s | %(request_id)s | %(name)s:%(lineno)d | %(message)s"
+    
+    # Fallback for records that did not pass through RequestIdFilter
+    FORMAT_DEFAULTS = {"request_id": "-"}
     
     def __init__(
         self,
@@ -144,6 +398,18 @@ class LogConfig:
         if self.log_to_file:
             self.log_dir.mkdir(parents=True, exist_ok=True)
     
+    def _make_file_handler(self, path: Path) -> logging.FileHandler:
+        """Create a rotating file handler using this configuration's rotation settings"""
+        return make_file_handler(
+            path,
+            rotation_type=self.rotation_type,
+            max_bytes=self.max_bytes,
+            backup_count=self.backup_count,
+            rotation_when=self.rotation_when,
+            rotation_interval=self.rotation_interval,
+            rotation_backup_count=self.rotation_backup_count,
+        )
+    
     def setup(self):
         """Setup logging configuration"""
         # Get root logger
@@ -153,16 +419,21 @@ class LogConfig:
         # Remove existing handlers to avoid duplicates
         root_logger.handlers.clear()
         
+        # Handlers run behind a QueueListener; see _attach_queue_handler
+        handlers = []
+        
         # Create colored formatter for console
         colored_formatter = ColoredFormatter(
             self.log_format,
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            defaults=self.FORMAT_DEFAULTS
         )
         
         # Create plain formatter for file
-        plain_formatter = logging.Formatter(
+        plain_formatter = CachedTimeFormatter(
             self.log_format,
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            defaults=self.FORMAT_DEFAULTS
         )
         
         # Console handler with colors
@@ -170,78 +441,32 @@ class LogConfig:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(self.log_level)
             console_handler.setFormatter(colored_formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # File handler without colors
         if self.log_to_file:
             log_file_path = self.log_dir / self.log_file
             
-            if self.rotation_type == "both":
-                # Rotate by both time AND size
-                file_handler = SizeAndTimeRotatingFileHandler(
-                    log_file_path,
-                    when=self.rotation_when,
-                    interval=self.rotation_interval,
-                    backupCount=self.rotation_backup_count,
-                    maxBytes=self.max_bytes,
-                    encoding='utf-8'
-                )
-            elif self.rotation_type == "time":
-                # Time-based rotation only (daily, weekly, etc.)
-                file_handler = TimedRotatingFileHandler(
-                    log_file_path,
-                    when=self.rotation_when,
-                    interval=self.rotation_interval,
-                    backupCount=self.rotation_backup_count,
-                    encoding='utf-8'
-                )
-            else:
-                # Size-based rotation only (default)
-                file_handler = RotatingFileHandler(
-                    log_file_path,
-                    maxBytes=self.max_bytes,
-                    backupCount=self.backup_count,
-                    encoding='utf-8'
-                )
+            file_handler = self._make_file_handler(log_file_path)
             
             file_handler.setLevel(self.log_level)
             file_handler.setFormatter(plain_formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
             
             # Add separate debug log file if log level is DEBUG
             if self.log_level == logging.DEBUG:
                 debug_log_path = self.log_dir / "debug.log"
                 
-                if self.rotation_type == "both":
-                    debug_handler = SizeAndTimeRotatingFileHandler(
-                        debug_log_path,
-                        when=self.rotation_when,
-                        interval=self.rotation_interval,
-                        backupCount=self.rotation_backup_count,
-                        maxBytes=self.max_bytes,
-                        encoding='utf-8'
-                    )
-                elif self.rotation_type == "time":
-                    debug_handler = TimedRotatingFileHandler(
-                        debug_log_path,
-                        when=self.rotation_when,
-                        interval=self.rotation_interval,
-                        backupCount=self.rotation_backup_count,
-                        encoding='utf-8'
-                    )
-                else:
-                    debug_handler = RotatingFileHandler(
-                        debug_log_path,
-                        maxBytes=self.max_bytes,
-                        backupCount=self.backup_count,
-                        encoding='utf-8'
-                    )
+                debug_handler = self._make_file_handler(debug_log_path)
                 
                 # Only log DEBUG level messages to debug.log
                 debug_handler.setLevel(logging.DEBUG)
-                debug_handler.addFilter(lambda record: record.levelno == logging.DEBUG)
+                debug_handler.addFilter(_debug_only_filter)
                 debug_handler.setFormatter(plain_formatter)
-                root_logger.addHandler(debug_handler)
+                handlers.append(debug_handler)
+        
+        if handlers:
+            _attach_queue_handler(root_logger, *handlers)
         
         # Configure third-party loggers to use our format
         # Set appropriate log levels for noisy loggers
@@ -273,9 +498,12 @@ class LogConfig:
         logging.getLogger('sqlalchemy').propagate = True
     
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_logger(name: str) -> logging.Logger:
         """
         Get a logger instance
+        Loggers are already singletons per name; the cache only skips the
+        logging manager's lock on repeated lookups
         
         Args:
             name: Logger name (typically __name__)
@@ -338,6 +566,8 @@ def setup_audit_logger(
     rotation_when: str = "midnight",
     rotation_interval: int = 1,
     rotation_backup_count: int = 30,
+    buffer_capacity: int = 512,
+    flush_interval: float = 0.05,
 ) -> logging.Logger:
     """
     Setup a separate audit logger for request/response logging
@@ -350,6 +580,8 @@ def setup_audit_logger(
         rotation_when: When to rotate - "midnight", "D", "H", etc. (for time-based)
         rotation_interval: Rotation interval (for time-based)
         rotation_backup_count: Number of backup files to keep (for time-based)
+        buffer_capacity: Audit records buffered before a batched file write
+        flush_interval: Maximum seconds an audit record stays buffered
     
     Returns:
         Configured audit logger instance
@@ -367,48 +599,35 @@ def setup_audit_logger(
     
     # Audit log format
     audit_format = "%(asctime)s | %(message)s"
-    formatter = logging.Formatter(audit_format, datefmt='%Y-%m-%d %H:%M:%S')
+    formatter = CachedTimeFormatter(audit_format, datefmt='%Y-%m-%d %H:%M:%S')
     
     # File handler for audit log
     audit_file = log_path / "audit.log"
     
-    if rotation_type.lower() == "both":
-        # Rotate by both time AND size
-        file_handler = SizeAndTimeRotatingFileHandler(
-            audit_file,
-            when=rotation_when,
-            interval=rotation_interval,
-            backupCount=rotation_backup_count,
-            maxBytes=max_bytes,
-            encoding='utf-8'
-        )
-    elif rotation_type.lower() == "time":
-        # Time-based rotation only
-        file_handler = TimedRotatingFileHandler(
-            audit_file,
-            when=rotation_when,
-            interval=rotation_interval,
-            backupCount=rotation_backup_count,
-            encoding='utf-8'
-        )
-    else:
-        # Size-based rotation only (default)
-        file_handler = RotatingFileHandler(
-            audit_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count,
-            encoding='utf-8'
-        )
+    file_handler = make_file_handler(
+        audit_file,
+        rotation_type=rotation_type,
+        max_bytes=max_bytes,
+        backup_count=backup_count,
+        rotation_when=rotation_when,
+        rotation_interval=rotation_interval,
+        rotation_backup_count=rotation_backup_count,
+    )
     
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
-    audit_logger.addHandler(file_handler)
     
     # Console handler for audit (optional, can be removed)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(ColoredFormatter(audit_format, datefmt='%Y-%m-%d %H:%M:%S'))
-    audit_logger.addHandler(console_handler)
+    
+    # Batch file writes; the buffer lives behind the queue, off the event loop
+    buffered_handler = BufferedFileHandler(file_handler, capacity=buffer_capacity, flush_interval=flush_interval)
+    buffered_handler.setLevel(logging.INFO)
+    
+    # Write from a background thread so requests never block on log I/O
+    _attach_queue_handler(audit_logger, buffered_handler, console_handler)
     
     return audit_logger
 
@@ -1,10 +1,12 @@
 """User Controller - REST API Endpoints"""
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 import logging
+import orjson
 
-from config.database_config import get_db_session
+from config.database_config import SessionLocal, get_db_session
 from service.user_service import UserService
 from schema.user import UserCreate, UserUpdate, UserResponse, UserListResponse
 from schema.common import MessageResponse
@@ -18,6 +20,9 @@ router = APIRouter(
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for page_size, so one request can't materialize the whole users table
+MAX_PAGE_SIZE = 100
+
 
 @router.post(
     "/",
@@ -30,10 +35,10 @@ def create_user(
     session: Session = Depends(get_db_session)
 ):
     """Create a new user"""
-    logger.info(f"Creating user: {user.username}")
+    logger.info("Creating user: %s", user.username)
     user_service = UserService(session)
     result = user_service.create_user(user)
-    logger.info(f"User created with ID: {result.id}")
+    logger.info("User created with ID: %d", result.id)
     return result
 
 
@@ -43,16 +48,42 @@ def create_user(
     summary="Get all users"
 )
 def get_users(
-    page: int = 1,
-    page_size: int = 10,
+    page: int = Query(1, ge=1, description="Page number (starts from 1)"),
+    page_size: int = Query(10, ge=1, le=MAX_PAGE_SIZE, description="Number of items per page"),
     session: Session = Depends(get_db_session)
 ):
     """Get paginated list of users"""
-    logger.debug(f"Fetching users: page={page}, page_size={page_size}")
+    logger.debug("Fetching users: page=%d, page_size=%d", page, page_size)
     user_service = UserService(session)
     return user_service.get_users(page=page, page_size=page_size)
 
 
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export all users as NDJSON"
+)
+def export_users():
+    """
+    Stream every user as newline-delimited JSON
+    Each export holds a pooled database connection and an open cursor until the
+    client has finished downloading, so slow clients tie up the connection pool
+    """
+    logger.info("Exporting users")
+    return StreamingResponse(_export_ndjson(), media_type="application/x-ndjson")
+
+
+def _export_ndjson():
+    """Yield NDJSON chunks, one per cursor batch"""
+    # The stream outlives the endpoint call, so it owns its session instead of using Depends
+    session = SessionLocal()
+    try:
+        for rows in UserService(session).stream_users():
+            yield b"".join(orjson.dumps(dict(row), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+    finally:
+        session.close()
+
+
 @router.get(
     "/{user_id}",
     response_model=UserResponse,
@@ -63,7 +94,7 @@ def get_user(
     session: Session = Depends(get_db_session)
 ):
     """Get user by ID"""
-    logger.debug(f"Fetching user: {user_id}")
+    logger.debug("Fetching user: %d", user_id)
     user_service = UserService(session)
     return user_service.get_user(user_id)
 
@@ -79,10 +110,10 @@ def update_user(
     session: Session = Depends(get_db_session)
 ):
     """Update user information"""
-    logger.info(f"Updating user: {user_id}")
+    logger.info("Updating user: %d", user_id)
     user_service = UserService(session)
     result = user_service.update_user(user_id, user_update)
-    logger.info(f"User updated: {user_id}")
+    logger.info("User updated: %d", user_id)
     return result
 
 
@@ -96,10 +127,10 @@ def delete_user(
     session: Session = Depends(get_db_session)
 ):
     """Delete user by ID"""
-    logger.info(f"Deleting user: {user_id}")
+    logger.info("Deleting user: %d", user_id)
     user_service = UserService(session)
     user_service.delete_user(user_id)
-    logger.info(f"User deleted: {user_id}")
+    logger.info("User deleted: %d", user_id)
     return MessageResponse(
         message=f"User with ID {user_id} deleted successfully",
         success=True
@@ -2,18 +2,21 @@
 FastAPI Starter Template - Main Entry Point
 """
 #test change
+import asyncio
 import logging
+import os
 import time
-import uuid
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from config.app_config import config
 from config.database_config import init_db, db
-from config.log_config import setup_logging, setup_audit_logger
+from config.log_config import request_id_var, setup_logging, setup_audit_logger, stop_logging
 from controller import user_router
 from common.util import generate_openapi_file, print_banner
 
@@ -44,36 +47,68 @@ audit_logger = setup_audit_logger(
 
 logger = logging.getLogger(__name__)
 
+# Set by the `python src/main.py` supervisor for its reload/worker subprocesses,
+# which then skip the banner and marker file handling (the parent prints it once)
+SUPERVISED_CHILD_ENV = "FASTAPI_STARTER_SUPERVISED"
+
+
+def _log_openapi_failure(future: asyncio.Future) -> None:
+    """Log an exception raised by background OpenAPI generation"""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Background OpenAPI generation failed: %s", exc, exc_info=exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan manager
     Handles startup and shutdown events
     """
+    supervised_child = os.environ.get(SUPERVISED_CHILD_ENV) == "1"
+    
     # Startup - Show banner
-    print_banner()
+    if not supervised_child:
+        print_banner()
     logger.info("Starting FastAPI application...")
+    
+    # Sync endpoints (and their blocking DB calls) run in anyio's worker thread pool
+    to_thread.current_default_thread_limiter().total_tokens = config.server_threadpool_size
+    
     try:
         init_db()
         logger.info("Database initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {str(e)}")
+        logger.error("Failed to initialize database: %s", e)
         raise
     
-    # Generate OpenAPI schema file
-    generate_openapi_file(app, output_path="openapi.json")
+    # Generate OpenAPI schema file in the background (dev only) so startup isn't delayed
+    openapi_future = None
+    if config.debug:
+        openapi_future = asyncio.get_running_loop().run_in_executor(
+            None, generate_openapi_file, app, "openapi.json"
+        )
+        openapi_future.add_done_callback(_log_openapi_failure)
     
     yield
     
     # Shutdown
     logger.info("Shutting down FastAPI application...")
+    
+    # A running executor job can't be cancelled; let it finish so openapi.json isn't half-written
+    if openapi_future is not None and not openapi_future.done():
+        await asyncio.wait({openapi_future})
     db.close()
     logger.info("Database connections closed")
     
     # Clean up banner marker file on shutdown
-    import os
-    if os.path.exists('.banner_session'):
+    if not supervised_child and os.path.exists('.banner_session'):
         os.remove('.banner_session')
+    
+    # Flush queued log records and stop the background log listeners
+    stop_logging()
 
 
 # Create FastAPI application
@@ -82,6 +117,7 @@ app = FastAPI(
     description="FastAPI Starter Template with SQLAlchemy Core, MySQL/Oracle support, and clean architecture",
     version="1.0.0",
     debug=config.debug,
+    default_response_class=ORJSONResponse,  # orjson serializes responses in C
     lifespan=lifespan
 )
 
@@ -89,35 +125,45 @@ app = FastAPI(
 app.add_middleware(
     CORSMiddleware,
     allow_origins=config.cors_origins,
-    allow_credentials=config.get("cors", "allow_credentials", True),
-    allow_methods=config.get("cors", "allow_methods", ["*"]),
-    allow_headers=config.get("cors", "allow_headers", ["*"]),
+    allow_credentials=config.cors_allow_credentials,
+    allow_methods=config.cors_allow_methods,
+    allow_headers=config.cors_allow_headers,
 )
 
 
-# Add request ID middleware
+# Add request ID + audit logging middleware (single middleware, one hop per request)
 @app.middleware("http")
-async def add_request_id(request: Request, call_next):
-    """Add unique request ID to each request for tracing"""
-    request_id = str(uuid.uuid4())
+async def log_requests(request: Request, call_next):
+    """Assign a unique request ID for tracing and log requests/responses to audit log"""
+    request_id = os.urandom(16).hex()  # 128 random bits as 32 hex chars, no UUID object
     request.state.request_id = request_id
     
-    response = await call_next(request)
+    # Expose the ID to every log record emitted while handling this request
+    token = request_id_var.set(request_id)
+    try:
+        response = await _call_with_audit(request, call_next, request_id)
+    finally:
+        request_id_var.reset(token)
+    
     response.headers["X-Request-ID"] = request_id
     return response
 
 
-# Add request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all incoming requests and responses to audit log"""
+async def _call_with_audit(request: Request, call_next, request_id: str):
+    """Run the request, writing REQUEST/RESPONSE audit lines when audit logging is on"""
+    # Skip timing and log argument building entirely when audit logging is off
+    if not audit_logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+    
     start_time = time.time()
-    request_id = getattr(request.state, 'request_id', 'unknown')
+    
+    # Read scope-derived values once (request.client/url rebuild objects per access)
+    method = request.method
+    path = request.url.path
+    client = request.client.host if request.client else "-"
     
     # Log incoming request
-    audit_logger.info(
-        f"REQUEST | {request_id} | {request.method} {request.url.path} | Client: {request.client.host}"
-    )
+    audit_logger.info("REQUEST | %s | %s %s | Client: %s", request_id, method, path, client)
     
     # Process request
     response = await call_next(request)
@@ -127,8 +173,8 @@ async def log_requests(request: Request, call_next):
     
     # Log response
     audit_logger.info(
-        f"RESPONSE | {request_id} | {request.method} {request.url.path} | "
-        f"Status: {response.status_code} | Time: {process_time:.3f}s"
+        "RESPONSE | %s | %s %s | Status: %d | Time: %.3fs",
+        request_id, method, path, response.status_code, process_time
     )
     
     return response
@@ -154,19 +200,37 @@ if __name__ == "__main__":
     import uvicorn
     import sys
     
-    logger.info(f"Starting {config.app_name} on {config.server_host}:{config.server_port}")
+    logger.info("Starting %s on %s:%s", config.app_name, config.server_host, config.server_port)
     
     # Add parent directory to path so src module can be imported
     project_root = Path(__file__).parent.parent
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
     
+    # SQLite can't be shared safely by several worker processes writing one file
+    workers = config.server_workers
+    if workers > 1 and config.db_type == "sqlite":
+        logger.warning("SQLite does not support multiple workers; starting 1 worker instead of %d", workers)
+        workers = 1
+    
+    # Multiple workers are incompatible with reload, so only pass them when reload is off
+    worker_options = {} if config.server_reload else {"workers": workers}
+    
+    # Reload and multi-worker modes run the app in subprocesses that each go through
+    # lifespan; print the banner once here and let the children skip it
+    if config.server_reload or workers > 1:
+        print_banner()
+        os.environ[SUPERVISED_CHILD_ENV] = "1"
+    
     # For direct python execution, use module path
     uvicorn.run(
         "src.main:app",
         host=config.server_host,
         port=config.server_port,
         reload=config.server_reload,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows support
+        http="httptools",
+        **worker_options,
         reload_excludes=[
             "**/logs/**",
             "**/*.log",
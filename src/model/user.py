@@ -4,19 +4,17 @@ User Model - SQLAlchemy ORM Entity Definition
 
 from sqlalchemy import String, Boolean
 from sqlalchemy.orm import Mapped, mapped_column
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
-from common.base import Base
-
-
-def utc_now() -> datetime:
-    """Return current UTC time with timezone info"""
-    return datetime.now(timezone.utc)
+from common.base import Base, utcnow
 
 
 class User(Base):
     """User entity - Spring Boot style ORM model"""
     __tablename__ = 'users'
+    # Fetch database-generated timestamps via RETURNING where supported; elsewhere
+    # (MySQL) they are loaded on first access instead of by an eager extra SELECT
+    __mapper_args__ = {"eager_defaults": "auto"}
     
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -33,11 +31,11 @@ class User(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=utc_now, nullable=False)
+    # Timestamps (set by the database)
+    created_at: Mapped[datetime] = mapped_column(server_default=utcnow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        default=utc_now, 
-        onupdate=utc_now, 
+        server_default=utcnow(), 
+        onupdate=utcnow(), 
         nullable=False
     )
     
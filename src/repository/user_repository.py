@@ -3,18 +3,107 @@ User Repository - Data Access Layer using SQLAlchemy ORM
 Spring Boot JPA-style repository pattern
 """
 
-from sqlalchemy import select, func
+from cachetools import TTLCache
+from sqlalchemy import bindparam, case, delete, event, func, insert, literal, or_, select, update
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Sequence, Tuple
+import threading
 
+from common.base import utcnow
 from model.user import User
 from schema.user import UserCreate, UserUpdate
 
+# Per-process cache of usernames/emails recently seen NOT to exist, keyed by
+# ("u", username) / ("e", email). Entries are dropped when this process commits
+# the value, but another worker process (or a lookup racing the commit) can
+# keep reporting a value that now exists as missing for up to the 30 s TTL.
+# Inserts stay correct regardless - the unique constraints reject duplicates.
+_missing_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_missing_lock = threading.Lock()  # TTLCache is not thread-safe
+
+# Columns needed by UserResponse - list queries select only these (no hashed_password)
+USER_RESPONSE_COLS = (
+    User.id,
+    User.username,
+    User.email,
+    User.full_name,
+    User.is_active,
+    User.is_superuser,
+    User.created_at,
+    User.updated_at,
+)
+
+# Fixed statements built once at import; per-call values go in as bound
+# parameters, so each call skips statement construction and cache-key generation
+_COUNT_USERS = select(func.count()).select_from(User)
+# Existence probes stop at the first matching index entry instead of counting
+_EXISTS_BY_USERNAME = (
+    select(literal(1)).select_from(User).where(User.username == bindparam("username")).limit(1)
+)
+_EXISTS_BY_EMAIL = (
+    select(literal(1)).select_from(User).where(User.email == bindparam("email")).limit(1)
+)
+_COUNT_BY_USERNAME_OR_EMAIL = (
+    select(
+        func.count(case((User.username == bindparam("username"), 1))),
+        func.count(case((User.email == bindparam("email"), 1))),
+    )
+    .select_from(User)
+    .where(or_(User.username == bindparam("username"), User.email == bindparam("email")))
+)
+# Nothing is loaded before a delete, so there are no session objects to synchronize
+_DELETE_BY_ID = (
+    delete(User)
+    .where(User.id == bindparam("user_id"))
+    .execution_options(synchronize_session=False)
+)
+
+
+def _is_known_missing(key: Tuple[str, str]) -> bool:
+    """Return True if key was recently looked up and did not exist"""
+    with _missing_lock:
+        return key in _missing_cache
+
+
+def _remember_missing(key: Tuple[str, str]) -> None:
+    """Record that key does not exist"""
+    with _missing_lock:
+        _missing_cache[key] = True
+
+
+def _forget_missing(*keys: Tuple[str, str]) -> None:
+    """Drop cached negatives for values that now exist"""
+    with _missing_lock:
+        for key in keys:
+            _missing_cache.pop(key, None)
+
+
+def _forget_missing_on_commit(session: Session, *keys: Tuple[str, str]) -> None:
+    """Drop cached negatives for keys once session commits the rows holding them"""
+    session.info.setdefault("forget_missing", set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+def _forget_committed_missing(session: Session) -> None:
+    """Invalidate after commit so no other session can re-cache the value as missing"""
+    keys = session.info.pop("forget_missing", None)
+    if keys:
+        _forget_missing(*keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_missing(session: Session) -> None:
+    """Rolled-back values never came to exist; keep their cached negatives"""
+    session.info.pop("forget_missing", None)
+
 
 class UserRepository:
     """Repository for user data access operations"""
     
+    # Created per request - slots skip the per-instance __dict__
+    __slots__ = ("session",)
+    
     def __init__(self, session: Session):
         """
         Initialize repository with database session
@@ -35,7 +124,7 @@ class UserRepository:
         Returns:
             Created User entity
         """
-        now = datetime.now(timezone.utc)
+        _forget_missing_on_commit(self.session, ("u", user.username), ("e", user.email))
         user_entity = User(
             username=user.username,
             email=user.email,
@@ -43,16 +132,67 @@ class UserRepository:
             hashed_password=hashed_password,
             is_active=True,
             is_superuser=False,
-            created_at=now,
-            updated_at=now
         )
         self.session.add(user_entity)
         self.session.flush()  # Flush to get the ID without committing
         return user_entity
     
+    def create_many(self, users: List[UserCreate], hashed_passwords: List[str]) -> List[int]:
+        """
+        Create several users in one batched INSERT
+        
+        Args:
+            users: User creation data
+            hashed_passwords: Hashed password for each user, in the same order
+            
+        Returns:
+            IDs of the created users, in input order
+            
+        Raises:
+            ValueError: If users and hashed_passwords differ in length
+        """
+        if len(users) != len(hashed_passwords):
+            raise ValueError(
+                f"Got {len(users)} users but {len(hashed_passwords)} hashed passwords"
+            )
+        if not users:
+            return []
+        
+        _forget_missing_on_commit(
+            self.session, *(("u", u.username) for u in users), *(("e", u.email) for u in users)
+        )
+        rows = [
+            {
+                "username": u.username,
+                "email": u.email,
+                "full_name": u.full_name,
+                "hashed_password": hashed,
+                "is_active": True,
+                "is_superuser": False,
+            }
+            for u, hashed in zip(users, hashed_passwords)
+        ]
+        
+        if self.session.get_bind().dialect.insert_executemany_returning:
+            # SQLite/Oracle: one multi-row INSERT ... RETURNING. Asking for
+            # sort_by_parameter_order would force one INSERT per row, so the
+            # rows come back unordered and are matched up by (unique) username
+            stmt = insert(User).returning(User.id, User.username)
+            ids_by_username = dict((name, user_id) for user_id, name in self.session.execute(stmt, rows))
+        else:
+            # MySQL has no RETURNING: one executemany (sent as a multi-row INSERT
+            # by the driver), then a single SELECT for the generated IDs
+            self.session.execute(insert(User), rows)
+            usernames = [row["username"] for row in rows]
+            stmt = select(User.username, User.id).where(User.username.in_(usernames))
+            ids_by_username = dict(self.session.execute(stmt).all())
+        return [ids_by_username[row["username"]] for row in rows]
+    
     def get_by_id(self, user_id: int) -> Optional[User]:
         """
         Get user by ID
+        Repeat lookups within a request are served from the session's identity
+        map without another query, so callers may fetch before mutating freely
         
         Args:
             user_id: User ID
@@ -62,20 +202,71 @@ class UserRepository:
         """
         return self.session.get(User, user_id)
     
-    def get_all(self, skip: int = 0, limit: int = 10) -> List[User]:
+    def get_all(self, skip: int = 0, limit: int = 10) -> Sequence[RowMapping]:
         """
         Get all users with pagination
+        Selects only the UserResponse columns, returned as row mappings (no ORM entities)
         
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
             
         Returns:
-            List of User entities
+            List of user row mappings
         """
-        stmt = select(User).offset(skip).limit(limit).order_by(User.id)
+        stmt = select(*USER_RESPONSE_COLS).offset(skip).limit(limit).order_by(User.id)
         result = self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.mappings().all()
+    
+    def get_all_stream(
+        self, skip: int = 0, limit: Optional[int] = None, batch_size: int = 200
+    ) -> Iterator[Sequence[RowMapping]]:
+        """
+        Stream users in batches from a server-side cursor
+        Only batch_size rows are held in memory at a time
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return (None for all)
+            batch_size: Rows fetched from the cursor per batch
+            
+        Yields:
+            Lists of user row mappings
+        """
+        stmt = (
+            select(*USER_RESPONSE_COLS)
+            .order_by(User.id)
+            .offset(skip)
+            .limit(limit)
+            .execution_options(stream_results=True, yield_per=batch_size)
+        )
+        yield from self.session.execute(stmt).mappings().partitions()
+    
+    def get_page(self, skip: int = 0, limit: int = 10) -> Tuple[Sequence[RowMapping], int]:
+        """
+        Get a page of users together with the total user count
+        The total comes from a COUNT(*) OVER() window column, so one statement does both
+        (window functions need SQLite 3.25+ / MySQL 8.0+, see README)
+        Selects only the UserResponse columns, returned as row mappings (no ORM entities)
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (list of user row mappings, total user count)
+        """
+        stmt = (
+            select(*USER_RESPONSE_COLS, func.count().over().label("_total"))
+            .order_by(User.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = self.session.execute(stmt).mappings().all()
+        if not rows:
+            # A page past the end has no row to carry the total
+            return [], self.count() if skip else 0
+        return rows, rows[0]["_total"]
     
     def count(self) -> int:
         """
@@ -84,13 +275,14 @@ class UserRepository:
         Returns:
             Total user count
         """
-        stmt = select(func.count()).select_from(User)
-        result = self.session.execute(stmt)
+        result = self.session.execute(_COUNT_USERS)
         return result.scalar()
     
     def update(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
         """
         Update user information
+        Uses a single UPDATE ... RETURNING where the database supports it
+        Explicit nulls for non-nullable columns (email, is_active) are ignored
         
         Args:
             user_id: User ID
@@ -98,23 +290,38 @@ class UserRepository:
             
         Returns:
             Updated User entity or None if not found
+            
+        Raises:
+            IntegrityError: If the new email belongs to another user
         """
+        # Update only provided fields; None can only clear nullable columns (full_name)
+        columns = User.__table__.c
+        update_data = {
+            key: value
+            for key, value in user_update.model_dump(exclude_unset=True).items()
+            if value is not None or columns[key].nullable
+        }
+        if update_data.get("email"):
+            _forget_missing_on_commit(self.session, ("e", update_data["email"]))
+        update_data["updated_at"] = utcnow()  # Rendered as SQL, evaluated by the database
+        
+        if self.session.get_bind().dialect.update_returning:
+            stmt = update(User).where(User.id == user_id).values(**update_data).returning(User)
+            return self.session.execute(stmt).scalars().first()
+        
+        # MySQL has no RETURNING; load the entity and let the unit of work update it
         user_entity = self.session.get(User, user_id)
         if not user_entity:
             return None
-        
-        # Update only provided fields
-        update_data = user_update.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(user_entity, key, value)
-        
-        user_entity.updated_at = datetime.now(timezone.utc)
         self.session.flush()  # Flush changes
         return user_entity
     
     def delete(self, user_id: int) -> bool:
         """
         Delete user by ID
+        Issues a single DELETE; the affected row count tells whether the user existed
         
         Args:
             user_id: User ID
@@ -122,13 +329,8 @@ class UserRepository:
         Returns:
             True if deleted, False otherwise
         """
-        user_entity = self.session.get(User, user_id)
-        if not user_entity:
-            return False
-        
-        self.session.delete(user_entity)
-        self.session.flush()
-        return True
+        result = self.session.execute(_DELETE_BY_ID, {"user_id": user_id})
+        return result.rowcount > 0
     
     def exists_by_username(self, username: str) -> bool:
         """
@@ -140,9 +342,37 @@ class UserRepository:
         Returns:
             True if exists, False otherwise
         """
-        stmt = select(func.count()).select_from(User).where(User.username == username)
-        result = self.session.execute(stmt)
-        return result.scalar() > 0
+        key = ("u", username)
+        if _is_known_missing(key):
+            return False
+        result = self.session.execute(_EXISTS_BY_USERNAME, {"username": username})
+        exists = result.first() is not None
+        if not exists:
+            _remember_missing(key)
+        return exists
+    
+    def exists_by_username_or_email(self, username: str, email: str) -> Tuple[bool, bool]:
+        """
+        Check username and email existence in a single query
+        
+        Args:
+            username: Username
+            email: Email address
+            
+        Returns:
+            Tuple of (username exists, email exists)
+        """
+        username_key, email_key = ("u", username), ("e", email)
+        if _is_known_missing(username_key) and _is_known_missing(email_key):
+            return False, False
+        
+        params = {"username": username, "email": email}
+        username_count, email_count = self.session.execute(_COUNT_BY_USERNAME_OR_EMAIL, params).one()
+        if not username_count:
+            _remember_missing(username_key)
+        if not email_count:
+            _remember_missing(email_key)
+        return username_count > 0, email_count > 0
     
     def exists_by_email(self, email: str) -> bool:
         """
@@ -154,6 +384,11 @@ class UserRepository:
         Returns:
             True if exists, False otherwise
         """
-        stmt = select(func.count()).select_from(User).where(User.email == email)
-        result = self.session.execute(stmt)
-        return result.scalar() > 0
+        key = ("e", email)
+        if _is_known_missing(key):
+            return False
+        result = self.session.execute(_EXISTS_BY_EMAIL, {"email": email})
+        exists = result.first() is not None
+        if not exists:
+            _remember_missing(key)
+        return exists
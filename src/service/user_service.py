@@ -3,6 +3,9 @@ User Service - Business Logic Layer
 Spring Boot-style service with entity-to-DTO conversion
 """
 
+from sqlalchemy.engine import RowMapping
+from typing import Iterator, Sequence
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
@@ -12,13 +15,44 @@ from repository.user_repository import UserRepository
 from schema.user import UserCreate, UserUpdate, UserResponse, UserListResponse
 from model.user import User
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: new hashes use argon2, existing bcrypt hashes still verify
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,  # KiB (64 MiB)
+    argon2__parallelism=1,
+)
+
+# UserResponse field names, read off User entities when building DTOs
+_RESPONSE_FIELDS = tuple(UserResponse.model_fields)
+
+
+def _is_duplicate_email(error: IntegrityError) -> bool:
+    """
+    Check whether an IntegrityError is the users.email unique violation
+    Drivers name the column (SQLite) or the ix_users_email index (MySQL, Oracle)
+    in their message
+    
+    Args:
+        error: IntegrityError raised by the database
+        
+    Returns:
+        True if the violated constraint is the unique email index
+    """
+    message = str(error.orig).lower()
+    return "email" in message and ("unique" in message or "duplicate" in message)
 
 
 class UserService:
     """Service for user business logic"""
     
+    # Created per request - slots skip the per-instance __dict__
+    __slots__ = ("repository",)
+    
+    # Shared logger, looked up once instead of per instance
+    logger = logging.getLogger(__name__)
+    
     def __init__(self, session: Session):
         """
         Initialize service with database session
@@ -27,12 +61,11 @@ class UserService:
             session: SQLAlchemy Session instance
         """
         self.repository = UserRepository(session)
-        self.logger = logging.getLogger(__name__)
     
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash password using bcrypt
+        Hash password using argon2
         
         Args:
             password: Plain text password
@@ -60,6 +93,7 @@ class UserService:
         """
         Convert User entity to UserResponse DTO
         Spring Boot-style entity-to-DTO conversion
+        Skips validation - the entity's values come from the database
         
         Args:
             user: User entity
@@ -67,7 +101,20 @@ class UserService:
         Returns:
             UserResponse DTO
         """
-        return UserResponse.model_validate(user)
+        return UserResponse.model_construct(**{f: getattr(user, f) for f in _RESPONSE_FIELDS})
+    
+    def _row_to_dto(self, row: RowMapping) -> UserResponse:
+        """
+        Convert a projected user row to UserResponse DTO
+        Skips validation - the row comes straight from the database columns
+        
+        Args:
+            row: Row mapping with the UserResponse columns
+            
+        Returns:
+            UserResponse DTO
+        """
+        return UserResponse.model_construct(**row)
     
     def create_user(self, user: UserCreate) -> UserResponse:
         """
@@ -84,8 +131,13 @@ class UserService:
         """
         self.logger.info(f"Creating new user: {user.username}")
         
+        # Check username and email in one round-trip
+        username_exists, email_exists = self.repository.exists_by_username_or_email(
+            user.username, user.email
+        )
+        
         # Check if username exists
-        if self.repository.exists_by_username(user.username):
+        if username_exists:
             self.logger.warning(f"Username already exists: {user.username}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -93,7 +145,7 @@ class UserService:
             )
         
         # Check if email exists
-        if self.repository.exists_by_email(user.email):
+        if email_exists:
             self.logger.warning(f"Email already exists: {user.email}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -103,8 +155,15 @@ class UserService:
         # Hash password
         hashed_password = self.hash_password(user.password)
         
-        # Create user entity
-        user_entity = self.repository.create(user, hashed_password)
+        # Create user entity; unique constraints still guard against a concurrent insert
+        try:
+            user_entity = self.repository.create(user, hashed_password)
+        except IntegrityError:
+            self.logger.warning(f"Username or email taken concurrently: {user.username}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Username or email already exists"
+            )
         self.logger.info(f"User created successfully with ID: {user_entity.id}")
         
         # Convert entity to DTO
@@ -147,19 +206,28 @@ class UserService:
             Paginated user list response
         """
         skip = (page - 1) * page_size
-        user_entities = self.repository.get_all(skip=skip, limit=page_size)
-        total = self.repository.count()
+        user_rows, total = self.repository.get_page(skip=skip, limit=page_size)
         
-        # Convert entities to DTOs
-        user_responses = [self._entity_to_dto(entity) for entity in user_entities]
+        # Convert projected rows to DTOs
+        user_responses = [self._row_to_dto(row) for row in user_rows]
         
-        return UserListResponse(
+        return UserListResponse.model_construct(
             users=user_responses,
             total=total,
             page=page,
             page_size=page_size
         )
     
+    def stream_users(self) -> Iterator[Sequence[RowMapping]]:
+        """
+        Stream every user in batches
+        
+        Returns:
+            Iterator over lists of user row mappings
+        """
+        self.logger.debug("Streaming all users")
+        return self.repository.get_all_stream()
+    
     def update_user(self, user_id: int, user_update: UserUpdate) -> UserResponse:
         """
         Update user information
@@ -176,30 +244,22 @@ class UserService:
         """
         self.logger.info(f"Updating user with ID: {user_id}")
         
-        # Check if user exists
-        existing_user = self.repository.get_by_id(user_id)
-        if not existing_user:
-            self.logger.warning(f"User not found for update: {user_id}")
+        # Update user; the unique email constraint rejects an email owned by another user
+        try:
+            updated_entity = self.repository.update(user_id, user_update)
+        except IntegrityError as e:
+            if not _is_duplicate_email(e):
+                raise
+            self.logger.warning(f"Email already exists: {user_update.email}")
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"User with ID {user_id} not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already exists"
             )
-        
-        # If email is being updated, check if it already exists
-        if user_update.email and user_update.email != existing_user.email:
-            if self.repository.exists_by_email(user_update.email):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already exists"
-                )
-        
-        # Update user
-        updated_entity = self.repository.update(user_id, user_update)
         if not updated_entity:
-            self.logger.error(f"Failed to update user with ID: {user_id}")
+            self.logger.warning(f"User not found for update: {user_id}")
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update user"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with ID {user_id} not found"
             )
         
         self.logger.info(f"User updated successfully: {user_id}")
@@ -220,22 +280,13 @@ class UserService:
         """
         self.logger.info(f"Deleting user with ID: {user_id}")
         
-        # Check if user exists
-        if not self.repository.get_by_id(user_id):
+        # Delete user; no matching row means the user does not exist
+        if not self.repository.delete(user_id):
             self.logger.warning(f"User not found for deletion: {user_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"User with ID {user_id} not found"
             )
         
-        # Delete user
-        success = self.repository.delete(user_id)
-        if not success:
-            self.logger.error(f"Failed to delete user with ID: {user_id}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete user"
-            )
-        
         self.logger.info(f"User deleted successfully: {user_id}")
         return True